@@ -11,7 +11,7 @@ from datetime import datetime
 
 from app.models import Source
 from app.extractors import get_extractor
-from app.scoring import calculate_specificity_score, calculate_trust_score
+from app.scoring import score_extraction
 
 router = APIRouter()
 
@@ -101,9 +101,7 @@ async def extract_source(request: ExtractionRequest):
             )
         
         # Calculate scores
-        quality_metrics = calculate_specificity_score(extraction_result.extracted_data)
-        trust = calculate_trust_score(extraction_result.extracted_data)
-        quality_metrics.trust_score = trust
+        quality_metrics = score_extraction(extraction_result.extracted_data)
         
         # Build Source object
         source = Source(
@@ -63,6 +63,9 @@ def source_db_to_model(db_source: SourceDB) -> Source:
             return ExtractedNumericField()
         return ExtractedNumericField(
             value=data.get("value"),
+            value_range_min=data.get("value_range_min"),
+            value_range_max=data.get("value_range_max"),
+            value_range=data.get("value_range"),
             confidence=data.get("confidence", 0),
             source_quote=data.get("source_quote"),
             interpretation=data.get("interpretation", "missing"),
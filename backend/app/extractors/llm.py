@@ -3,6 +3,7 @@ LLM-based strategy extraction using Google Gemini.
 Extracts structured strategy data with confidence scores and source quotes.
 """
 
+import re
 import json
 import asyncio
 from typing import Optional
@@ -10,6 +11,13 @@ from typing import Optional
 import google.generativeai as genai
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+# orjson parses large LLM responses several times faster; fall back to stdlib.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from app.config import get_settings
 from app.models import (
     ExtractedStrategy,
@@ -85,6 +93,10 @@ def build_extraction_prompt(content: str) -> str:
     return prompt
 
 
+# Content shorter than this cannot describe a strategy; skip the LLM call
+MIN_CONTENT_CHARS = 100
+
+
 # ============================================================================
 # Chunking for Long Transcripts
 # ============================================================================
@@ -146,6 +158,16 @@ def _normalize_interpretation(value: str) -> str:
     return "missing"
 
 
+_NUMBER_RE = re.compile(r'[-+]?\d*\.?\d+')
+
+
+def _truncate_quote(quote: Optional[str]) -> Optional[str]:
+    """Trim source quotes to fit the 500-char schema limit."""
+    if quote and len(quote) > 450:
+        return quote[:447] + "..."
+    return quote
+
+
 def _parse_field(data: dict, key: str) -> ExtractedField:
     """Parse a field from JSON into ExtractedField."""
     if not data or key not in data:
@@ -153,52 +175,51 @@ def _parse_field(data: dict, key: str) -> ExtractedField:
     
     field_data = data[key]
     if isinstance(field_data, dict):
-        quote = field_data.get("source_quote")
-        if quote and len(quote) > 450:
-            quote = quote[:447] + "..."
+        value = field_data.get("value")
+        confidence = field_data.get("confidence")
         return ExtractedField(
-            value=str(field_data.get("value", "")) if field_data.get("value") else None,
-            confidence=float(field_data.get("confidence", 0)) if field_data.get("confidence") else 0.0,
-            source_quote=quote,
+            value=str(value) if value else None,
+            confidence=float(confidence) if confidence else 0.0,
+            source_quote=_truncate_quote(field_data.get("source_quote")),
             interpretation=_normalize_interpretation(field_data.get("interpretation", "missing")),
         )
     return ExtractedField(value=str(field_data) if field_data else None, confidence=0.5)
 
 
+def _extract_number(val) -> Optional[float]:
+    """Extract number from value, handles strings like '30 points' or '0.16'."""
+    if val is None:
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    if isinstance(val, str):
+        # Try to extract first number from string
+        match = _NUMBER_RE.search(val)
+        if match:
+            return float(match.group())
+    return None
+
+
 def _parse_numeric_field(data: dict, key: str) -> ExtractedNumericField:
     """Parse a numeric field from JSON into ExtractedNumericField."""
     if not data or key not in data:
         return ExtractedNumericField()
     
-    def extract_number(val):
-        """Extract number from value, handles strings like '30 points' or '0.16'."""
-        if val is None:
-            return None
-        if isinstance(val, (int, float)):
-            return float(val)
-        if isinstance(val, str):
-            # Try to extract first number from string
-            import re
-            match = re.search(r'[-+]?\d*\.?\d+', val)
-            if match:
-                return float(match.group())
-        return None
-    
     field_data = data[key]
     if isinstance(field_data, dict):
-        value = extract_number(field_data.get("value"))
         value_range = field_data.get("value_range")
-        quote = field_data.get("source_quote")
-        if quote and len(quote) > 450:
-            quote = quote[:447] + "..."
+        if not (isinstance(value_range, list) and len(value_range) == 2):
+            value_range = (None, None)
+        confidence = field_data.get("confidence")
         return ExtractedNumericField(
-            value=value,
-            value_range=tuple(value_range) if value_range and isinstance(value_range, list) else None,
-            confidence=float(field_data.get("confidence", 0)) if field_data.get("confidence") else 0.0,
-            source_quote=quote,
+            value=_extract_number(field_data.get("value")),
+            value_range_min=_extract_number(value_range[0]),
+            value_range_max=_extract_number(value_range[1]),
+            confidence=float(confidence) if confidence else 0.0,
+            source_quote=_truncate_quote(field_data.get("source_quote")),
             interpretation=_normalize_interpretation(field_data.get("interpretation", "missing")),
         )
-    return ExtractedNumericField(value=extract_number(field_data), confidence=0.5)
+    return ExtractedNumericField(value=_extract_number(field_data), confidence=0.5)
 
 
 def _extract_string_list(items: list) -> list[str]:
@@ -239,7 +260,7 @@ def _parse_extraction(json_str: str) -> ExtractedStrategy:
         
         clean_json = clean_json[start_idx:end_idx + 1]
         
-        data = json.loads(clean_json)
+        data = _json_loads(clean_json)
         
         return ExtractedStrategy(
             strategy_name=_parse_field(data, "strategy_name"),
@@ -315,6 +336,11 @@ async def extract_strategy_from_text(content: str) -> ExtractedStrategy:
         # Return empty extraction if no API key
         return ExtractedStrategy()
     
+    # Skip empty/degenerate content (e.g. blank transcripts)
+    content = content.strip()
+    if len(content) < MIN_CONTENT_CHARS:
+        return ExtractedStrategy()
+    
     # Check content length
     if len(content) > settings.max_transcript_tokens * 4:  # Rough char-to-token estimate
         # Use map-reduce for long content
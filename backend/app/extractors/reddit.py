@@ -1,43 +1,170 @@
 """
 Reddit post and comment extractor.
-Extracts posts and all comments using PRAW.
+Extracts posts and top comments using PRAW.
 """
 
 import re
+import string
+import asyncio
+import threading
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.extractors.base import BaseExtractor, ExtractionResult
 from app.models import PlatformMetrics
 from app.extractors.llm import extract_strategy_from_text
+from app.extractors.cache import TTLCache
 from app.config import get_settings
 
 
+# Single regex for Reddit URLs: full post links (www/old) or redd.it short links
+_REDDIT_URL_RE = re.compile(
+    r'(?:https?://)?'
+    r'(?:(?:www\.|old\.)?reddit\.com/r/\w+/comments/(?P<full>\w+)'
+    r'|redd\.it/(?P<short>\w+))'
+)
+
+# Canonical post URL prefixes, checked with plain string ops before the regex
+_POST_URL_PREFIXES = (
+    "https://www.reddit.com/r/",
+    "https://old.reddit.com/r/",
+    "https://reddit.com/r/",
+)
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+# Comment fetch limits: each "more comments" expansion is an extra API call,
+# and LLM extraction only uses the top of a long thread anyway
+MORE_COMMENTS_LIMIT = 8
+MORE_COMMENTS_THRESHOLD = 5
+MAX_COMMENTS = 200
+
+# Friendly messages for common API errors: (lowercase needle, message)
+_ERROR_MESSAGES = (
+    ("404", "Reddit post not found (deleted or private)"),
+    ("not found", "Reddit post not found (deleted or private)"),
+    ("403", "Access denied - check Reddit API credentials"),
+)
+
+# Fetched posts by ID, so retries/re-submits skip the Reddit API
+_post_cache = TTLCache(maxsize=256, ttl=3600)
+
+
+def _fast_post_id(url: str) -> Optional[str]:
+    """Extract post ID from a canonical /r/<sub>/comments/<id> URL without regex."""
+    if not url.startswith(_POST_URL_PREFIXES):
+        return None
+    rest = url.split("/r/", 1)[1]
+    subreddit, sep, tail = rest.partition("/comments/")
+    if not sep or not subreddit or not _WORD_CHARS.issuperset(subreddit):
+        return None
+    post_id = tail.partition("/")[0]
+    if post_id and _WORD_CHARS.issuperset(post_id):
+        return post_id
+    return None
+
+
+# PRAW clients per worker thread. A praw.Reddit instance is not thread-safe
+# (one requests session, rate limiter and token state), so concurrent
+# extractions must not share one; each thread reuses its own instead.
+_thread_clients = threading.local()
+
+
+def _get_reddit(client_id: str, client_secret: str, user_agent: str):
+    """Get the calling thread's cached PRAW client so its session and auth token are reused."""
+    clients = getattr(_thread_clients, "clients", None)
+    if clients is None:
+        clients = _thread_clients.clients = {}
+    
+    key = (client_id, client_secret, user_agent)
+    reddit = clients.get(key)
+    if reddit is None:
+        import praw
+        
+        reddit = clients[key] = praw.Reddit(
+            client_id=client_id,
+            client_secret=client_secret,
+            user_agent=user_agent,
+        )
+    return reddit
+
+
+def _fetch_submission_sync(reddit, post_id: str) -> dict:
+    """Fetch a submission and its comments (blocking PRAW network I/O)."""
+    # Fetch submission
+    submission = reddit.submission(id=post_id)
+    
+    # Get post content
+    title = submission.title
+    author = str(submission.author) if submission.author else "[deleted]"
+    post_body = submission.selftext or ""
+    
+    # Expand a bounded number of comment trees, keep the highest-scored comments
+    submission.comments.replace_more(limit=MORE_COMMENTS_LIMIT, threshold=MORE_COMMENTS_THRESHOLD)
+    comments = sorted(
+        submission.comments.list(),
+        key=lambda c: c.__dict__.get("score", 0),
+        reverse=True,
+    )[:MAX_COMMENTS]
+    
+    # Build post header + comments in one buffer, joined once
+    header = f"# {title}\n\n{post_body}\n\n## Comments\n\n"
+    parts = [header]
+    sep = ""
+    for comment in comments:
+        # Comments are fully loaded here; read their attribute dict directly
+        # to skip PRAW's lazy-fetch attribute machinery
+        attrs = comment.__dict__
+        body = attrs.get("body")
+        if not body:
+            continue
+        author_obj = attrs.get("author")
+        comment_author = author_obj.name if author_obj is not None else "[deleted]"
+        comment_score = attrs.get("score", 0)
+        parts.append(sep)
+        parts.append(f"[{comment_author} | +{comment_score}]: {body}")
+        sep = "\n\n---\n\n"
+    
+    # Combined post + comments for extraction
+    full_content = "".join(parts)
+    comment_content = full_content[len(header):]
+    
+    return {
+        "title": title,
+        "author": author,
+        "post_body": post_body,
+        "full_content": full_content,
+        "comment_content": comment_content,
+        "score": submission.score,
+        "num_comments": submission.num_comments,
+        "created_utc": submission.created_utc,
+    }
+
+
+def _fetch_post_sync(client_id: str, client_secret: str, user_agent: str, post_id: str) -> dict:
+    """Fetch a submission with the worker thread's own PRAW client."""
+    reddit = _get_reddit(client_id, client_secret, user_agent)
+    return _fetch_submission_sync(reddit, post_id)
+
+
 class RedditExtractor(BaseExtractor):
     """Extractor for Reddit posts and comments."""
     
-    # Regex patterns for Reddit URLs
-    URL_PATTERNS = [
-        r'(?:https?://)?(?:www\.)?reddit\.com/r/(\w+)/comments/(\w+)',
-        r'(?:https?://)?(?:old\.)?reddit\.com/r/(\w+)/comments/(\w+)',
-        r'(?:https?://)?redd\.it/(\w+)',
-    ]
-    
     def validate_url(self, url: str) -> bool:
         """Check if URL is a valid Reddit URL."""
-        return any(re.search(p, url) for p in self.URL_PATTERNS)
+        if _fast_post_id(url):
+            return True
+        return _REDDIT_URL_RE.search(url) is not None
     
     def extract_post_id(self, url: str) -> Optional[str]:
         """Extract post ID from Reddit URL."""
-        for pattern in self.URL_PATTERNS:
-            match = re.search(pattern, url)
-            if match:
-                # Handle redd.it short links (just ID)
-                if "redd.it" in url:
-                    return match.group(1)
-                # Handle full URLs (subreddit, post_id)
-                return match.group(2)
-        return None
+        post_id = _fast_post_id(url)
+        if post_id:
+            return post_id
+        
+        match = _REDDIT_URL_RE.search(url)
+        if not match:
+            return None
+        return match.group("full") or match.group("short")
     
     async def extract(self, url: str) -> ExtractionResult:
         """Extract post content and comments from Reddit."""
@@ -59,54 +186,35 @@ class RedditExtractor(BaseExtractor):
             )
         
         try:
-            import praw
-            
-            # Initialize Reddit API client
-            reddit = praw.Reddit(
-                client_id=settings.reddit_client_id,
-                client_secret=settings.reddit_client_secret,
-                user_agent=settings.reddit_user_agent,
-            )
-            
-            # Fetch submission
-            submission = reddit.submission(id=post_id)
-            
-            # Get post content
-            title = submission.title
-            author = str(submission.author) if submission.author else "[deleted]"
-            post_body = submission.selftext or ""
-            
-            # Get all comments
-            submission.comments.replace_more(limit=None)  # Expand all comment trees
-            comments = []
-            
-            for comment in submission.comments.list():
-                if hasattr(comment, 'body') and comment.body:
-                    comment_author = str(comment.author) if comment.author else "[deleted]"
-                    comment_score = comment.score if hasattr(comment, 'score') else 0
-                    comments.append(f"[{comment_author} | +{comment_score}]: {comment.body}")
-            
-            comment_content = "\n\n---\n\n".join(comments)
-            
-            # Combine post + comments for extraction
-            full_content = f"# {title}\n\n{post_body}\n\n## Comments\n\n{comment_content}"
+            # Serve repeat requests for the same post from cache
+            post = _post_cache.get(post_id)
+            if post is None:
+                # PRAW is blocking; fetch in a worker thread to keep the event loop free
+                post = await asyncio.to_thread(
+                    _fetch_post_sync,
+                    settings.reddit_client_id,
+                    settings.reddit_client_secret,
+                    settings.reddit_user_agent,
+                    post_id,
+                )
+                _post_cache.set(post_id, post)
             
             # Run LLM extraction
-            extracted_data = await extract_strategy_from_text(full_content)
+            extracted_data = await extract_strategy_from_text(post["full_content"])
             
             # Get published date
-            published_date = datetime.fromtimestamp(submission.created_utc)
+            published_date = datetime.fromtimestamp(post["created_utc"], tz=timezone.utc)
             
             return ExtractionResult(
                 success=True,
-                title=title,
-                author=author,
+                title=post["title"],
+                author=post["author"],
                 published_date=published_date,
-                content=post_body,
-                comment_content=comment_content,
+                content=post["post_body"],
+                comment_content=post["comment_content"],
                 platform_metrics=PlatformMetrics(
-                    upvotes=submission.score,
-                    comments=submission.num_comments,
+                    upvotes=post["score"],
+                    comments=post["num_comments"],
                 ),
                 extracted_data=extracted_data,
             )
@@ -114,10 +222,11 @@ class RedditExtractor(BaseExtractor):
         except Exception as e:
             error_msg = str(e)
             
-            if "404" in error_msg or "not found" in error_msg.lower():
-                error_msg = "Reddit post not found (deleted or private)"
-            elif "403" in error_msg:
-                error_msg = "Access denied - check Reddit API credentials"
+            error_lower = error_msg.lower()
+            for needle, friendly_msg in _ERROR_MESSAGES:
+                if needle in error_lower:
+                    error_msg = friendly_msg
+                    break
             
             return ExtractionResult(
                 success=False,
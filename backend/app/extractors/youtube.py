@@ -4,55 +4,119 @@ Extracts video metadata and transcript using youtube-transcript-api.
 """
 
 import re
+import string
+import asyncio
 from typing import Optional
-from datetime import datetime
-
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.formatters import TextFormatter
 
 from app.extractors.base import BaseExtractor, ExtractionResult
 from app.models import PlatformMetrics
 from app.extractors.llm import extract_strategy_from_text
+from app.extractors.cache import TTLCache
+
+
+# Single regex for YouTube URLs: watch, embed, and youtu.be short links
+_YOUTUBE_URL_RE = re.compile(
+    r'(?:https?://)?(?:www\.)?'
+    r'(?:youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)'
+    r'([a-zA-Z0-9_-]{11})'
+)
+
+# Canonical URL prefixes that are followed directly by the video ID.
+# Checked with plain string ops before falling back to the regex.
+_VIDEO_ID_PREFIXES = (
+    "https://www.youtube.com/watch?v=",
+    "https://youtube.com/watch?v=",
+    "https://youtu.be/",
+    "https://www.youtube.com/embed/",
+)
+_VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Friendly messages for common transcript errors: (lowercase needle, message)
+_ERROR_MESSAGES = (
+    ("disabled", "Transcripts are disabled for this video"),
+    ("no transcript", "No transcript available for this video"),
+    ("video unavailable", "Video is unavailable (private, deleted, or restricted)"),
+)
+
+# Per-video caches so retries/re-submits skip the network entirely
+_metadata_cache = TTLCache(maxsize=512)
+_transcript_cache = TTLCache(maxsize=128, ttl=3600)
+
+# Shared HTTP session for oEmbed lookups (keeps connections alive between videos)
+_session = None
+
+
+async def _get_session():
+    """Get the shared aiohttp session, creating it on first use."""
+    global _session
+    import aiohttp
+    
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared aiohttp session (called on app shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def _fetch_transcript_text(video_id: str) -> str:
+    """Fetch transcript using instance-based API (v1.2.x) and format to plain text."""
+    # Imported lazily to keep app startup fast
+    from youtube_transcript_api import YouTubeTranscriptApi
+    from youtube_transcript_api.formatters import TextFormatter
+    
+    api = YouTubeTranscriptApi()
+    transcript_list = api.fetch(video_id)
+    return TextFormatter().format_transcript(transcript_list)
 
 
 class YouTubeExtractor(BaseExtractor):
     """Extractor for YouTube video transcripts."""
     
-    # Regex patterns for YouTube URLs
-    URL_PATTERNS = [
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-    ]
-    
     def validate_url(self, url: str) -> bool:
         """Check if URL is a valid YouTube URL."""
         return self.extract_video_id(url) is not None
     
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        for pattern in self.URL_PATTERNS:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        # Fast path: canonical URLs need no regex
+        for prefix in _VIDEO_ID_PREFIXES:
+            if url.startswith(prefix):
+                video_id = url[len(prefix):len(prefix) + 11]
+                if len(video_id) == 11 and _VIDEO_ID_CHARS.issuperset(video_id):
+                    return video_id
+                break
+        
+        match = _YOUTUBE_URL_RE.search(url)
+        return match.group(1) if match else None
     
     async def get_video_metadata(self, video_id: str) -> dict:
         """Fetch video metadata (title, channel) from YouTube oEmbed API."""
-        import aiohttp
+        cached = _metadata_cache.get(video_id)
+        if cached is not None:
+            return cached
         
         oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(oembed_url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "title": data.get("title", f"YouTube Video {video_id}"),
-                            "author": data.get("author_name", "Unknown Channel"),
-                            "author_url": data.get("author_url", ""),
-                        }
+            session = await _get_session()
+            async with session.get(oembed_url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    metadata = {
+                        "title": data.get("title", f"YouTube Video {video_id}"),
+                        "author": data.get("author_name", "Unknown Channel"),
+                        "author_url": data.get("author_url", ""),
+                    }
+                    _metadata_cache.set(video_id, metadata)
+                    return metadata
         except Exception:
             pass
         
@@ -62,6 +126,17 @@ class YouTubeExtractor(BaseExtractor):
             "author_url": "",
         }
     
+    async def get_transcript_text(self, video_id: str) -> str:
+        """Fetch video transcript as plain text."""
+        cached = _transcript_cache.get(video_id)
+        if cached is not None:
+            return cached
+        
+        # Transcript API (v1.2.x) is blocking, so run it in a worker thread
+        transcript_text = await asyncio.to_thread(_fetch_transcript_text, video_id)
+        _transcript_cache.set(video_id, transcript_text)
+        return transcript_text
+    
     async def extract(self, url: str) -> ExtractionResult:
         """Extract transcript and strategy from YouTube video."""
         
@@ -74,19 +149,14 @@ class YouTubeExtractor(BaseExtractor):
             )
         
         try:
-            # Fetch real metadata (channel name, video title)
-            metadata = await self.get_video_metadata(video_id)
+            # Fetch real metadata (channel name, video title) and transcript concurrently
+            metadata, transcript_text = await asyncio.gather(
+                self.get_video_metadata(video_id),
+                self.get_transcript_text(video_id),
+            )
             channel_name = metadata["author"]
             video_title = metadata["title"]
             
-            # Fetch transcript using instance-based API (v1.2.x)
-            api = YouTubeTranscriptApi()
-            transcript_list = api.fetch(video_id)
-            
-            # Format transcript to plain text
-            formatter = TextFormatter()
-            transcript_text = formatter.format_transcript(transcript_list)
-            
             # Run LLM extraction
             extracted_data = await extract_strategy_from_text(transcript_text)
             
@@ -109,12 +179,11 @@ class YouTubeExtractor(BaseExtractor):
             error_msg = str(e)
             
             # Handle common errors
-            if "disabled" in error_msg.lower():
-                error_msg = "Transcripts are disabled for this video"
-            elif "no transcript" in error_msg.lower():
-                error_msg = "No transcript available for this video"
-            elif "video unavailable" in error_msg.lower():
-                error_msg = "Video is unavailable (private, deleted, or restricted)"
+            error_lower = error_msg.lower()
+            for needle, friendly_msg in _ERROR_MESSAGES:
+                if needle in error_lower:
+                    error_msg = friendly_msg
+                    break
             
             return ExtractionResult(
                 success=False,
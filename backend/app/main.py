@@ -11,6 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api import extract, strategies, discover, sources
 from app.db.database import init_db
 from app.middleware.logging import LoggingMiddleware
+from app.extractors.youtube import close_session
 
 # Create FastAPI app
 app = FastAPI(
@@ -50,6 +51,12 @@ async def startup_event():
     await init_db()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared HTTP sessions on shutdown."""
+    await close_session()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -4,8 +4,7 @@ Request/response logging middleware.
 
 import time
 import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Configure logger
 logging.basicConfig(
@@ -15,35 +14,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger("strategy_finder")
 
+# Liveness probe paths that are passed through without logging
+SKIP_LOG_PATHS = frozenset({"/health"})
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all requests and responses."""
 
-    async def dispatch(self, request: Request, call_next):
+class LoggingMiddleware:
+    """Pure ASGI middleware to log all requests and responses."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in SKIP_LOG_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
         # Start timer
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Get request info
-        method = request.method
-        path = request.url.path
-        query = str(request.query_params) if request.query_params else ""
+        method = scope["method"]
+        path = scope["path"]
+        query = scope.get("query_string", b"").decode("latin-1")
         
         # Log request
-        logger.info(f"→ {method} {path} {query}")
+        logger.info("→ %s %s %s", method, path, query)
+        
+        # Capture status code from the response start message
+        status_code = 500
+        
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
         
         # Process request
         try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            
-            # Log response
-            logger.info(f"← {method} {path} | {response.status_code} | {duration_ms:.1f}ms")
-            
-            return response
+            await self.app(scope, receive, send_wrapper)
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"✗ {method} {path} | ERROR | {duration_ms:.1f}ms | {str(e)}")
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            logger.error("✗ %s %s | ERROR | %.1fms | %s", method, path, duration_ms, e)
             raise
+        
+        # Calculate duration
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        
+        # Log response
+        logger.info("← %s %s | %s | %.1fms", method, path, status_code, duration_ms)
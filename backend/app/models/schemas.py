@@ -4,15 +4,25 @@ These define the schema for LLM extraction output.
 """
 
 from typing import Optional, List, Literal
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from pydantic_core import ArgsKwargs
+from pydantic.dataclasses import dataclass
+from datetime import datetime, timezone
+
+
+# Shared model config. Defaults built by default_factory are trusted and not
+# re-validated, and unknown keys from LLM output are dropped, not stored.
+_MODEL_CONFIG = ConfigDict(extra="ignore", validate_default=False)
 
 
 # ============================================================================
 # Extracted Field with Confidence
 # ============================================================================
+# Leaf fields are validated slotted dataclasses rather than BaseModels: a
+# strategy holds ~30 of them, and slots drop the per-instance __dict__.
 
-class ExtractedField(BaseModel):
+@dataclass(slots=True, config=_MODEL_CONFIG)
+class ExtractedField:
     """A single extracted field with confidence and source quote."""
     value: Optional[str] = None
     confidence: float = Field(default=0.0, ge=0.0, le=1.0)
@@ -20,13 +30,45 @@ class ExtractedField(BaseModel):
     interpretation: Literal["explicit", "implicit", "inferred", "missing"] = "missing"
 
 
-class ExtractedNumericField(BaseModel):
+@dataclass(slots=True, config=_MODEL_CONFIG)
+class ExtractedNumericField:
     """Extracted numeric field with range support."""
     value: Optional[float] = None
-    value_range: Optional[tuple[float, float]] = None
+    value_range_min: Optional[float] = None
+    value_range_max: Optional[float] = None
     confidence: float = Field(default=0.0, ge=0.0, le=1.0)
     source_quote: Optional[str] = Field(default=None, max_length=500)
     interpretation: Literal["explicit", "implicit", "inferred", "missing"] = "missing"
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _split_value_range(cls, data):
+        """Accept the serialized value_range pair as input for the two bounds."""
+        kwargs = data.kwargs if isinstance(data, ArgsKwargs) else data
+        if not isinstance(kwargs, dict):
+            return data
+        value_range = kwargs.get("value_range")
+        if (
+            value_range is not None
+            and kwargs.get("value_range_min") is None
+            and kwargs.get("value_range_max") is None
+            and isinstance(value_range, (list, tuple))
+            and len(value_range) == 2
+        ):
+            kwargs = {**kwargs, "value_range_min": value_range[0], "value_range_max": value_range[1]}
+            if isinstance(data, ArgsKwargs):
+                return ArgsKwargs(data.args, kwargs)
+            return kwargs
+        return data
+    
+    # Emitted in serialized output: the frontend renders value_range
+    @computed_field
+    @property
+    def value_range(self) -> Optional[tuple[float, float]]:
+        """(min, max) range if both bounds were extracted."""
+        if self.value_range_min is None or self.value_range_max is None:
+            return None
+        return (self.value_range_min, self.value_range_max)
 
 
 # ============================================================================
@@ -35,6 +77,8 @@ class ExtractedNumericField(BaseModel):
 
 class SetupRules(BaseModel):
     """Strategy setup/entry rules."""
+    model_config = _MODEL_CONFIG
+    
     underlying: ExtractedField = Field(default_factory=ExtractedField)
     option_type: ExtractedField = Field(default_factory=ExtractedField)
     strike_selection: ExtractedField = Field(default_factory=ExtractedField)
@@ -52,6 +96,8 @@ class SetupRules(BaseModel):
 
 class ManagementRules(BaseModel):
     """Strategy management/exit rules."""
+    model_config = _MODEL_CONFIG
+    
     profit_target: ExtractedField = Field(default_factory=ExtractedField)
     stop_loss: ExtractedField = Field(default_factory=ExtractedField)
     time_exit: ExtractedField = Field(default_factory=ExtractedField)
@@ -66,6 +112,8 @@ class ManagementRules(BaseModel):
 
 class RiskProfile(BaseModel):
     """Risk characteristics of the strategy."""
+    model_config = _MODEL_CONFIG
+    
     max_loss_per_trade: ExtractedField = Field(default_factory=ExtractedField)
     win_rate: ExtractedNumericField = Field(default_factory=ExtractedNumericField)
     risk_reward_ratio: ExtractedField = Field(default_factory=ExtractedField)
@@ -78,6 +126,8 @@ class RiskProfile(BaseModel):
 
 class PerformanceClaims(BaseModel):
     """P&L and performance data claimed by author."""
+    model_config = _MODEL_CONFIG
+    
     starting_capital: ExtractedNumericField = Field(default_factory=ExtractedNumericField)
     ending_capital: ExtractedNumericField = Field(default_factory=ExtractedNumericField)
     total_return_percent: ExtractedNumericField = Field(default_factory=ExtractedNumericField)
@@ -92,6 +142,8 @@ class PerformanceClaims(BaseModel):
 
 class FailureModeAnalysis(BaseModel):
     """Analysis of failure modes and bias detection."""
+    model_config = _MODEL_CONFIG
+    
     failure_modes_mentioned: List[str] = Field(default_factory=list)
     discusses_losses: bool = False
     max_drawdown_mentioned: Optional[float] = None
@@ -105,6 +157,8 @@ class FailureModeAnalysis(BaseModel):
 
 class MarketContext(BaseModel):
     """Market conditions at time of publication."""
+    model_config = _MODEL_CONFIG
+    
     published_date: Optional[datetime] = None
     vix_level: Optional[float] = None
     vix_percentile: Optional[float] = None
@@ -119,6 +173,8 @@ class MarketContext(BaseModel):
 
 class ExtractedStrategy(BaseModel):
     """Complete extracted strategy data from a source."""
+    model_config = _MODEL_CONFIG
+    
     strategy_name: ExtractedField = Field(default_factory=ExtractedField)
     variation: ExtractedField = Field(default_factory=ExtractedField)
     trader_name: ExtractedField = Field(default_factory=ExtractedField)
@@ -139,7 +195,8 @@ class ExtractedStrategy(BaseModel):
 # Quality Metrics
 # ============================================================================
 
-class SpecificityBreakdown(BaseModel):
+@dataclass(slots=True, config=_MODEL_CONFIG)
+class SpecificityBreakdown:
     """Detailed breakdown of specificity score."""
     strike_selection: float = 0.0
     entry_criteria: float = 0.0
@@ -155,6 +212,8 @@ class SpecificityBreakdown(BaseModel):
 
 class QualityMetrics(BaseModel):
     """Quality scoring for extracted content."""
+    model_config = _MODEL_CONFIG
+    
     specificity_score: float = Field(default=0.0, ge=0.0, le=10.0)
     specificity_breakdown: SpecificityBreakdown = Field(default_factory=SpecificityBreakdown)
     trust_score: float = Field(default=0.0, ge=0.0, le=10.0)
@@ -169,6 +228,8 @@ class QualityMetrics(BaseModel):
 
 class PlatformMetrics(BaseModel):
     """Engagement metrics from source platform."""
+    model_config = _MODEL_CONFIG
+    
     views: Optional[int] = None
     likes: Optional[int] = None
     dislikes: Optional[int] = None
@@ -184,6 +245,8 @@ class PlatformMetrics(BaseModel):
 
 class Source(BaseModel):
     """A complete source with extracted data."""
+    model_config = _MODEL_CONFIG
+    
     id: str
     url: str
     source_type: Literal["youtube", "reddit", "article"]
@@ -200,5 +263,5 @@ class Source(BaseModel):
     extracted_data: ExtractedStrategy = Field(default_factory=ExtractedStrategy)
     quality_metrics: QualityMetrics = Field(default_factory=QualityMetrics)
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
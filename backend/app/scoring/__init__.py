@@ -1,4 +1,12 @@
 # Scoring package
-from app.scoring.scorer import calculate_specificity_score, calculate_trust_score
+from app.scoring.scorer import (
+    calculate_specificity_score,
+    calculate_trust_score,
+    score_extraction,
+)
 
-__all__ = ["calculate_specificity_score", "calculate_trust_score"]
+__all__ = [
+    "calculate_specificity_score",
+    "calculate_trust_score",
+    "score_extraction",
+]
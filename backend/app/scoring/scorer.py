@@ -3,7 +3,10 @@ Specificity and Trust score calculation.
 Implements the scoring rubric from the PRD.
 """
 
-from typing import List
+from collections import namedtuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional
 from app.models import (
     ExtractedStrategy,
     QualityMetrics,
@@ -39,102 +42,144 @@ TRUST_WEIGHTS = {
     "balanced_claims": 0.20,
 }
 
+# Weight values in criterion order, for index-free summation in the scorers
+_SPECIFICITY_W = tuple(SPECIFICITY_WEIGHTS.values())
+_TRUST_W = tuple(TRUST_WEIGHTS.values())
+
+
+def _weighted_round(scores: tuple, weights: tuple) -> float:
+    """Weighted sum of criterion scores, rounded to one decimal."""
+    total = 0.0
+    for score, weight in zip(scores, weights):
+        total += score * weight
+    return round(total, 1)
+
 
 # ============================================================================
 # Specificity Scoring
 # ============================================================================
 
-def _score_field_specificity(field, field_name: str) -> float:
+# (base, confidence multiplier) per interpretation type
+_INTERPRETATION_SCORES = {
+    "explicit": (8.0, 2.0),  # 8-10
+    "implicit": (5.0, 3.0),  # 5-8
+    "inferred": (2.0, 3.0),  # 2-5
+}
+
+
+# Scoring-relevant attributes of an extracted field, read once per field
+_FieldSnap = namedtuple("_FieldSnap", "confidence interpretation has_value")
+
+# Fields scored for specificity, fetched from an extraction in one call
+_get_specificity_fields = attrgetter(
+    "setup_rules.strike_selection",
+    "setup_rules.delta",
+    "setup_rules.entry_criteria",
+    "setup_rules.dte",
+    "setup_rules.buying_power_effect",
+    "management_rules.profit_target",
+    "management_rules.stop_loss",
+    "management_rules.adjustment_rules",
+    "management_rules.defensive_maneuvers",
+)
+
+
+def _snap(field) -> _FieldSnap:
+    """Snapshot the attributes of an extracted field used for scoring."""
+    return _FieldSnap(
+        getattr(field, 'confidence', 0.0),
+        getattr(field, 'interpretation', 'missing'),
+        getattr(field, 'value', None) is not None,
+    )
+
+
+# Snapshots are hashable and hold every input, and most fields repeat a few
+# (missing / default / high-confidence) states, so results are memoized
+@lru_cache(maxsize=1024)
+def _score_field_specificity(snap: _FieldSnap) -> float:
     """Score a single field's specificity (0-10)."""
-    if not field or not hasattr(field, 'confidence'):
+    if snap.interpretation == "missing" or not snap.has_value:
         return 0.0
     
-    # Base score from confidence
-    confidence = getattr(field, 'confidence', 0)
-    interpretation = getattr(field, 'interpretation', 'missing')
-    value = getattr(field, 'value', None)
-    
-    if interpretation == "missing" or value is None:
-        return 0.0
-    
-    # Score based on interpretation type
-    if interpretation == "explicit":
-        base_score = 8.0 + (confidence * 2.0)  # 8-10
-    elif interpretation == "implicit":
-        base_score = 5.0 + (confidence * 3.0)  # 5-8
-    elif interpretation == "inferred":
-        base_score = 2.0 + (confidence * 3.0)  # 2-5
-    else:
-        base_score = 1.0
-    
-    return min(10.0, base_score)
+    # Base score from interpretation type, scaled by confidence
+    params = _INTERPRETATION_SCORES.get(snap.interpretation)
+    if params is None:
+        return 1.0
+    base, multiplier = params
+    return min(10.0, base + snap.confidence * multiplier)
 
 
-def calculate_specificity_score(extraction: ExtractedStrategy) -> QualityMetrics:
+def _failure_score(failure_analysis) -> float:
+    """Score how well failure modes are discussed (0-10). Shared by both scores."""
+    if failure_analysis.failure_modes_mentioned:
+        return min(10, len(failure_analysis.failure_modes_mentioned) * 3 + 4)
+    if failure_analysis.discusses_losses:
+        return 5.0
+    return 0.0
+
+
+def calculate_specificity_score(
+    extraction: ExtractedStrategy,
+    failure_score: Optional[float] = None,
+) -> QualityMetrics:
     """
     Calculate specificity score for extracted strategy.
     Returns QualityMetrics with breakdown.
+    Pass a precomputed failure_score to avoid recomputing it.
     """
-    breakdown = SpecificityBreakdown()
     gaps = []
     
+    # Snapshot scored fields in one pass
+    (
+        strike_field, delta_field, entry_field, dte_field, bpe_field,
+        profit_field, stop_field, adjust_field, defensive_field,
+    ) = map(_snap, _get_specificity_fields(extraction))
+    
     # Score each criterion
     
     # 1. Strike Selection
-    strike_score = _score_field_specificity(extraction.setup_rules.strike_selection, "strike_selection")
+    strike_score = _score_field_specificity(strike_field)
     if extraction.setup_rules.delta.value:
-        strike_score = (strike_score + _score_field_specificity(extraction.setup_rules.delta, "delta")) / 2
-    breakdown.strike_selection = strike_score
+        strike_score = (strike_score + _score_field_specificity(delta_field)) / 2
     if strike_score < 3:
         gaps.append("Strike selection not clearly defined")
     
     # 2. Entry Criteria
-    entry_score = _score_field_specificity(extraction.setup_rules.entry_criteria, "entry_criteria")
-    breakdown.entry_criteria = entry_score
+    entry_score = _score_field_specificity(entry_field)
     if entry_score < 3:
         gaps.append("Entry criteria unclear")
     
     # 3. DTE
-    dte_score = _score_field_specificity(extraction.setup_rules.dte, "dte")
-    breakdown.dte = dte_score
+    dte_score = _score_field_specificity(dte_field)
     if dte_score < 3:
         gaps.append("DTE not specified")
     
     # 4. Buying Power Effect
-    bpe_score = _score_field_specificity(extraction.setup_rules.buying_power_effect, "buying_power_effect")
-    breakdown.buying_power_effect = bpe_score
+    bpe_score = _score_field_specificity(bpe_field)
     if bpe_score < 3:
         gaps.append("Position sizing/BPE not defined")
     
     # 5. Profit Target
-    profit_score = _score_field_specificity(extraction.management_rules.profit_target, "profit_target")
-    breakdown.profit_target = profit_score
+    profit_score = _score_field_specificity(profit_field)
     if profit_score < 3:
         gaps.append("Profit target not specified")
     
     # 6. Stop Loss
-    stop_score = _score_field_specificity(extraction.management_rules.stop_loss, "stop_loss")
-    breakdown.stop_loss = stop_score
+    stop_score = _score_field_specificity(stop_field)
     if stop_score < 3:
         gaps.append("Stop loss not defined")
     
     # 7. Adjustments/Defense
     adjust_score = max(
-        _score_field_specificity(extraction.management_rules.adjustment_rules, "adjustments"),
-        _score_field_specificity(extraction.management_rules.defensive_maneuvers, "defensive")
+        _score_field_specificity(adjust_field),
+        _score_field_specificity(defensive_field),
     )
-    breakdown.adjustments = adjust_score
     if adjust_score < 3:
         gaps.append("Adjustment/defense strategy not explained")
     
     # 8. Failure Modes
-    if extraction.failure_analysis.failure_modes_mentioned:
-        failure_score = min(10, len(extraction.failure_analysis.failure_modes_mentioned) * 3 + 4)
-    elif extraction.failure_analysis.discusses_losses:
-        failure_score = 5.0
-    else:
-        failure_score = 0.0
-    breakdown.failure_modes = failure_score
+    if failure_score is None:
+        failure_score = _failure_score(extraction.failure_analysis)
     if failure_score < 3:
         gaps.append("Failure modes not discussed")
     
@@ -146,7 +191,6 @@ def calculate_specificity_score(extraction: ExtractedStrategy) -> QualityMetrics
             pnl_score = 10.0
     elif extraction.performance_claims.total_return_percent.value:
         pnl_score = 6.0
-    breakdown.real_pnl = pnl_score
     
     # 10. Backtest Evidence
     backtest_score = 0.0
@@ -154,26 +198,39 @@ def calculate_specificity_score(extraction: ExtractedStrategy) -> QualityMetrics
         backtest_score = 7.0
         if extraction.risk_profile.max_drawdown.value:
             backtest_score = 10.0
-    breakdown.backtest_evidence = backtest_score
     if backtest_score < 3:
         gaps.append("No backtest or historical data")
     
-    # Calculate weighted total
-    total_score = (
-        breakdown.strike_selection * SPECIFICITY_WEIGHTS["strike_selection"] +
-        breakdown.entry_criteria * SPECIFICITY_WEIGHTS["entry_criteria"] +
-        breakdown.dte * SPECIFICITY_WEIGHTS["dte"] +
-        breakdown.buying_power_effect * SPECIFICITY_WEIGHTS["buying_power_effect"] +
-        breakdown.profit_target * SPECIFICITY_WEIGHTS["profit_target"] +
-        breakdown.stop_loss * SPECIFICITY_WEIGHTS["stop_loss"] +
-        breakdown.adjustments * SPECIFICITY_WEIGHTS["adjustments"] +
-        breakdown.failure_modes * SPECIFICITY_WEIGHTS["failure_modes"] +
-        breakdown.real_pnl * SPECIFICITY_WEIGHTS["real_pnl"] +
-        breakdown.backtest_evidence * SPECIFICITY_WEIGHTS["backtest_evidence"]
+    # Calculate weighted total (scores in SPECIFICITY_WEIGHTS order)
+    scores = (
+        strike_score,
+        entry_score,
+        dte_score,
+        bpe_score,
+        profit_score,
+        stop_score,
+        adjust_score,
+        failure_score,
+        pnl_score,
+        backtest_score,
+    )
+    total_score = _weighted_round(scores, _SPECIFICITY_W)
+    
+    breakdown = SpecificityBreakdown(
+        strike_selection=strike_score,
+        entry_criteria=entry_score,
+        dte=dte_score,
+        buying_power_effect=bpe_score,
+        profit_target=profit_score,
+        stop_loss=stop_score,
+        adjustments=adjust_score,
+        failure_modes=failure_score,
+        real_pnl=pnl_score,
+        backtest_evidence=backtest_score,
     )
     
     return QualityMetrics(
-        specificity_score=round(total_score, 1),
+        specificity_score=total_score,
         specificity_breakdown=breakdown,
         has_backtest=backtest_score >= 7.0,
         has_real_pnl=pnl_score >= 6.0,
@@ -185,29 +242,24 @@ def calculate_specificity_score(extraction: ExtractedStrategy) -> QualityMetrics
 # Trust Score
 # ============================================================================
 
-def calculate_trust_score(extraction: ExtractedStrategy) -> float:
+def calculate_trust_score(
+    extraction: ExtractedStrategy,
+    failure_score: Optional[float] = None,
+) -> float:
     """
     Calculate trust score based on bias detection.
     Returns score 0-10.
+    Pass a precomputed failure_score to avoid recomputing it.
     """
-    score = 0.0
-    
     # 1. Discusses failures (30%)
-    if extraction.failure_analysis.failure_modes_mentioned:
-        failure_count = len(extraction.failure_analysis.failure_modes_mentioned)
-        failure_score = min(10, failure_count * 3 + 4)
-    elif extraction.failure_analysis.discusses_losses:
-        failure_score = 5.0
-    else:
-        failure_score = 0.0
-    score += failure_score * TRUST_WEIGHTS["discusses_failures"]
+    if failure_score is None:
+        failure_score = _failure_score(extraction.failure_analysis)
     
     # 2. Mentions drawdowns (25%)
     if extraction.failure_analysis.max_drawdown_mentioned or extraction.risk_profile.max_drawdown.value:
         drawdown_score = 10.0
     else:
         drawdown_score = 0.0
-    score += drawdown_score * TRUST_WEIGHTS["mentions_drawdowns"]
     
     # 3. Shows losing trades (25%)
     # Hard to detect directly, use bias_detected flag
@@ -217,7 +269,6 @@ def calculate_trust_score(extraction: ExtractedStrategy) -> float:
         losing_score = 5.0
     else:
         losing_score = 0.0
-    score += losing_score * TRUST_WEIGHTS["shows_losing_trades"]
     
     # 4. Balanced claims (20%)
     # Check if warnings are present
@@ -225,6 +276,22 @@ def calculate_trust_score(extraction: ExtractedStrategy) -> float:
         balanced_score = min(10, len(extraction.warnings) * 3 + 4)
     else:
         balanced_score = 2.0  # Some content is just educational, not promotional
-    score += balanced_score * TRUST_WEIGHTS["balanced_claims"]
     
-    return round(score, 1)
+    # Weighted total (scores in TRUST_WEIGHTS order)
+    scores = (failure_score, drawdown_score, losing_score, balanced_score)
+    return _weighted_round(scores, _TRUST_W)
+
+
+# ============================================================================
+# Combined Scoring
+# ============================================================================
+
+def score_extraction(extraction: ExtractedStrategy) -> QualityMetrics:
+    """
+    Calculate specificity and trust scores in one pass.
+    Returns QualityMetrics with trust_score filled in.
+    """
+    failure_score = _failure_score(extraction.failure_analysis)
+    metrics = calculate_specificity_score(extraction, failure_score)
+    metrics.trust_score = calculate_trust_score(extraction, failure_score)
+    return metrics
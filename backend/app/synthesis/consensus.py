@@ -3,48 +3,86 @@ Consensus synthesis from multiple sources.
 Identifies agreements, controversies, and gaps.
 """
 
+import sys
 from typing import List, Dict, Any
-from pydantic import BaseModel
-from collections import defaultdict
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+from collections import Counter
+from operator import attrgetter
 
 from app.models import ExtractedStrategy
 
 
-class ConsensusItem(BaseModel):
+# Result types are slotted pydantic dataclasses: they are built per topic on
+# every synthesis, and FastAPI serializes them the same way as models.
+
+@dataclass(slots=True)
+class ConsensusItem:
     """A topic where sources agree or have positions."""
     topic: str
     consensus_value: str | None = None
     agreement_rate: float = 0.0
-    positions: List[Dict[str, Any]] = []
-    sources: List[str] = []
+    positions: List[Dict[str, Any]] = Field(default_factory=list)
+    sources: List[str] = Field(default_factory=list)
 
 
-class Controversy(BaseModel):
+@dataclass(slots=True)
+class Controversy:
     """A topic where sources disagree."""
     topic: str
-    positions: List[Dict[str, Any]] = []
+    positions: List[Dict[str, Any]] = Field(default_factory=list)
 
 
-class ConsensusResult(BaseModel):
+@dataclass(slots=True)
+class ConsensusResult:
     """Result of consensus synthesis."""
     sources_analyzed: int
-    consensus: List[ConsensusItem] = []
-    controversies: List[Controversy] = []
-    gaps: List[str] = []
+    consensus: List[ConsensusItem] = Field(default_factory=list)
+    controversies: List[Controversy] = Field(default_factory=list)
+    gaps: List[str] = Field(default_factory=list)
 
 
 def _extract_value(field) -> str | None:
     """Extract string value from ExtractedField."""
-    if hasattr(field, 'value') and field.value:
-        return str(field.value)
-    return None
+    value = getattr(field, 'value', None)
+    if not value:
+        return None
+    # Most values are already strings; skip the no-op str() call
+    return value if type(value) is str else str(value)
 
 
 def _normalize_value(value: str | None) -> str | None:
-    """Normalize value for comparison."""
+    """Normalize value for comparison (interned, as values repeat across sources)."""
     if value is None:
         return None
-    return value.lower().strip()
+    # Extractor output is often already lowercase; avoid copying it
+    if not value.islower():
+        value = value.lower()
+    return sys.intern(value.strip())
+
+
+# Topics to analyze: (name, field getter)
+_TOPICS = (
+    ("Underlying", attrgetter("setup_rules.underlying")),
+    ("Option Type", attrgetter("setup_rules.option_type")),
+    ("Strike Selection", attrgetter("setup_rules.strike_selection")),
+    ("DTE", attrgetter("setup_rules.dte")),
+    ("Delta", attrgetter("setup_rules.delta")),
+    ("Entry Criteria", attrgetter("setup_rules.entry_criteria")),
+    ("Profit Target", attrgetter("management_rules.profit_target")),
+    ("Stop Loss", attrgetter("management_rules.stop_loss")),
+    ("Adjustments", attrgetter("management_rules.adjustment_rules")),
+    ("Time Exit", attrgetter("management_rules.time_exit")),
+)
+
+
+# Topics commonly missing across sources: (name, has-data check)
+_GAP_TOPICS = (
+    ("Stop Loss", lambda e: e.management_rules.stop_loss.interpretation != "missing"),
+    ("Adjustments", lambda e: e.management_rules.adjustment_rules.interpretation != "missing"),
+    ("Failure Modes", lambda e: bool(e.failure_analysis.failure_modes_mentioned)),
+    ("Backtest Data", lambda e: e.risk_profile.win_rate.value is not None),
+)
 
 
 def synthesize_consensus(extractions: List[ExtractedStrategy]) -> ConsensusResult:
@@ -58,65 +96,47 @@ def synthesize_consensus(extractions: List[ExtractedStrategy]) -> ConsensusResul
     consensus_items = []
     controversies = []
     gaps = []
+    gap_prefixes = set()  # First word of each gap's topic, for dedup
     
-    # Topics to analyze
-    topics = [
-        ("Underlying", lambda e: _extract_value(e.setup_rules.underlying)),
-        ("Option Type", lambda e: _extract_value(e.setup_rules.option_type)),
-        ("Strike Selection", lambda e: _extract_value(e.setup_rules.strike_selection)),
-        ("DTE", lambda e: str(e.setup_rules.dte.value) if e.setup_rules.dte.value else None),
-        ("Delta", lambda e: str(e.setup_rules.delta.value) if e.setup_rules.delta.value else None),
-        ("Entry Criteria", lambda e: _extract_value(e.setup_rules.entry_criteria)),
-        ("Profit Target", lambda e: _extract_value(e.management_rules.profit_target)),
-        ("Stop Loss", lambda e: _extract_value(e.management_rules.stop_loss)),
-        ("Adjustments", lambda e: _extract_value(e.management_rules.adjustment_rules)),
-        ("Time Exit", lambda e: _extract_value(e.management_rules.time_exit)),
-    ]
-    
-    for topic_name, extractor in topics:
-        # Collect values from all sources
-        values = []
-        for i, extraction in enumerate(extractions):
-            value = extractor(extraction)
-            if value:
-                values.append({
-                    "value": value,
-                    "normalized": _normalize_value(value),
-                    "source_index": i,
-                })
+    for topic_name, get_field in _TOPICS:
+        # Collect raw and normalized values from all sources (None = no value)
+        raw_values = [_extract_value(get_field(extraction)) for extraction in extractions]
+        normalized = [_normalize_value(v) if v else None for v in raw_values]
+        counts = Counter(v for v in normalized if v is not None)
         
-        if not values:
+        if not counts:
             gaps.append(f"{topic_name} not mentioned in any source")
+            gap_prefixes.add(topic_name.split(None, 1)[0])
             continue
         
-        # Group by normalized value
-        groups = defaultdict(list)
-        for v in values:
-            groups[v["normalized"]].append(v)
-        
         # Check for consensus
-        if len(groups) == 1:
+        if len(counts) == 1:
             # Full agreement
-            value = list(groups.keys())[0]
+            indices = [i for i, v in enumerate(normalized) if v is not None]
             consensus_items.append(ConsensusItem(
                 topic=topic_name,
-                consensus_value=values[0]["value"],  # Use original case
-                agreement_rate=len(values) / n,
-                sources=[f"Source {v['source_index'] + 1}" for v in values],
+                consensus_value=raw_values[indices[0]],  # Use original case
+                agreement_rate=len(indices) / n,
+                sources=[f"Source {i + 1}" for i in indices],
             ))
         else:
-            # Disagreement - create controversy
+            # Disagreement - group source indices by normalized value
+            groups = {}
+            for i, v in enumerate(normalized):
+                if v is not None:
+                    groups.setdefault(v, []).append(i)
+            
+            # most_common() orders by source count (most popular first),
+            # ties in first-seen order
             positions = []
-            for norm_value, group in groups.items():
+            for norm_value, count in counts.most_common():
+                indices = groups[norm_value]
                 positions.append({
-                    "value": group[0]["value"],
-                    "source_count": len(group),
-                    "sources": [f"Source {v['source_index'] + 1}" for v in group],
+                    "value": raw_values[indices[0]],
+                    "source_count": count,
+                    "sources": [f"Source {i + 1}" for i in indices],
                 })
             
-            # Sort by source count (most popular first)
-            positions.sort(key=lambda p: p["source_count"], reverse=True)
-            
             # If one position has majority, it's still partial consensus
             top_count = positions[0]["source_count"]
             agreement_rate = top_count / n
@@ -137,19 +157,21 @@ def synthesize_consensus(extractions: List[ExtractedStrategy]) -> ConsensusResul
                     positions=positions,
                 ))
     
-    # Check for common gaps
-    gap_topics = [
-        ("Stop Loss", lambda e: e.management_rules.stop_loss.interpretation != "missing"),
-        ("Adjustments", lambda e: e.management_rules.adjustment_rules.interpretation != "missing"),
-        ("Failure Modes", lambda e: bool(e.failure_analysis.failure_modes_mentioned)),
-        ("Backtest Data", lambda e: e.risk_profile.win_rate.value is not None),
-    ]
-    
-    for topic_name, has_data in gap_topics:
-        sources_with_data = sum(1 for e in extractions if has_data(e))
-        if sources_with_data < n * 0.5:
-            if topic_name not in [g.split()[0] for g in gaps]:
+    # Check for common gaps: a topic is a gap unless at least half the
+    # sources cover it, so stop counting once that threshold is reached
+    threshold = (n + 1) // 2
+    for topic_name, has_data in _GAP_TOPICS:
+        sources_with_data = 0
+        for extraction in extractions:
+            if has_data(extraction):
+                sources_with_data += 1
+                if sources_with_data >= threshold:
+                    break
+        if sources_with_data < threshold:
+            prefix = topic_name.split(None, 1)[0]
+            if prefix not in gap_prefixes:
                 gaps.append(f"{topic_name} missing in most sources")
+                gap_prefixes.add(prefix)
     
     return ConsensusResult(
         sources_analyzed=n,
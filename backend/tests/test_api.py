@@ -26,6 +26,12 @@ class TestAPIEndpoints:
         assert data["status"] == "healthy"
         assert "version" in data
 
+    def test_health_check_not_logged(self, client, caplog):
+        """Test that liveness probes bypass request logging."""
+        with caplog.at_level("INFO", logger="strategy_finder"):
+            client.get("/health")
+        assert "/health" not in caplog.text
+
     # TC-API-002: Extract endpoint with valid YouTube URL
     def test_extract_youtube_url_structure(self, client):
         """Test extract endpoint returns correct structure."""
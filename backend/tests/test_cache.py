@@ -0,0 +1,41 @@
+"""
+Unit tests for the extractor in-memory cache.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app.extractors.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_get_missing_returns_none(self):
+        """Test that a missing key returns None."""
+        cache = TTLCache()
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries older than the TTL are dropped."""
+        cache = TTLCache(ttl=60)
+        with patch("app.extractors.cache.time.monotonic", return_value=1000.0):
+            cache.set("video", "transcript")
+        with patch("app.extractors.cache.time.monotonic", return_value=1030.0):
+            assert cache.get("video") == "transcript"
+        with patch("app.extractors.cache.time.monotonic", return_value=1061.0):
+            assert cache.get("video") is None
+        assert len(cache) == 0
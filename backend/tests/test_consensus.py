@@ -0,0 +1,68 @@
+"""
+Unit tests for consensus synthesis.
+"""
+
+import pytest
+from app.synthesis.consensus import synthesize_consensus
+from app.models import (
+    ExtractedStrategy,
+    ExtractedField,
+    SetupRules,
+)
+
+
+def _strategy(underlying=None) -> ExtractedStrategy:
+    """Create a strategy with the given underlying."""
+    return ExtractedStrategy(
+        setup_rules=SetupRules(
+            underlying=ExtractedField(value=underlying, confidence=1.0, interpretation="explicit"),
+        ),
+    )
+
+
+class TestConsensusSynthesis:
+    """Test suite for synthesize_consensus."""
+
+    def test_empty_extractions(self):
+        """Test that no extractions yields an empty result."""
+        result = synthesize_consensus([])
+        assert result.sources_analyzed == 0
+        assert result.consensus == []
+
+    def test_full_agreement_ignores_case(self):
+        """Test that values differing only in case/whitespace agree."""
+        result = synthesize_consensus([_strategy("SPX"), _strategy("spx "), _strategy(None)])
+        
+        item = next(c for c in result.consensus if c.topic == "Underlying")
+        assert item.consensus_value == "SPX"
+        assert item.agreement_rate == pytest.approx(2 / 3)
+        assert item.sources == ["Source 1", "Source 2"]
+
+    def test_majority_consensus_keeps_minority_positions(self):
+        """Test that a 60%+ majority is consensus with minority positions."""
+        result = synthesize_consensus([
+            _strategy("SPX"), _strategy("SPX"), _strategy("SPX"), _strategy("SPY"), _strategy("QQQ"),
+        ])
+        
+        item = next(c for c in result.consensus if c.topic == "Underlying")
+        assert item.consensus_value == "SPX"
+        assert [p["value"] for p in item.positions] == ["SPY", "QQQ"]
+
+    def test_controversy_positions_sorted_by_count(self):
+        """Test that split opinions become a controversy, most popular first."""
+        result = synthesize_consensus([
+            _strategy("SPY"), _strategy("SPX"), _strategy("SPX"), _strategy("QQQ"),
+        ])
+        
+        controversy = next(c for c in result.controversies if c.topic == "Underlying")
+        assert [p["value"] for p in controversy.positions] == ["SPX", "SPY", "QQQ"]
+        assert controversy.positions[0]["sources"] == ["Source 2", "Source 3"]
+
+    def test_gaps_detected(self):
+        """Test that topics no source mentions are reported as gaps."""
+        result = synthesize_consensus([_strategy("SPX")])
+        
+        assert "Stop Loss not mentioned in any source" in result.gaps
+        assert "Failure Modes missing in most sources" in result.gaps
+        # Stop Loss already reported, not duplicated as "missing in most sources"
+        assert "Stop Loss missing in most sources" not in result.gaps
@@ -4,7 +4,14 @@ Test cases TC-LLM-001 through TC-LLM-005.
 """
 
 import pytest
-from app.extractors.llm import _parse_field, _parse_numeric_field, _parse_extraction
+from unittest.mock import patch, AsyncMock
+
+from app.extractors.llm import (
+    _parse_field,
+    _parse_numeric_field,
+    _parse_extraction,
+    extract_strategy_from_text,
+)
 from app.models import ExtractedField, ExtractedNumericField
 
 
@@ -106,3 +113,14 @@ class TestLLMExtraction:
         ```'''
         extraction = _parse_extraction(json_str)
         assert extraction.strategy_name.value == "Wheel"
+
+    @pytest.mark.asyncio
+    async def test_extract_skips_empty_content(self):
+        """Test that blank content returns empty extraction without calling Gemini."""
+        with patch("app.extractors.llm.settings") as mock_settings, \
+                patch("app.extractors.llm._call_gemini", new_callable=AsyncMock) as mock_call:
+            mock_settings.gemini_api_key = "test_key"
+            extraction = await extract_strategy_from_text("   \n\t  ")
+        
+        assert extraction.strategy_name.value is None
+        mock_call.assert_not_called()
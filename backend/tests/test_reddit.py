@@ -4,7 +4,10 @@ Test cases TC-RD-001 through TC-RD-005.
 """
 
 import pytest
-from app.extractors.reddit import RedditExtractor
+from types import SimpleNamespace
+
+from app.extractors import reddit
+from app.extractors.reddit import RedditExtractor, _fetch_submission_sync
 
 
 class TestRedditExtractor:
@@ -58,3 +61,67 @@ class TestRedditExtractor:
         """Test URL validation for invalid URLs."""
         assert not self.extractor.validate_url("https://youtube.com/watch?v=abc")
         assert not self.extractor.validate_url("not a url")
+
+
+def _comment(body, score, author="user"):
+    """Fake loaded PRAW comment (attributes live in __dict__)."""
+    return SimpleNamespace(
+        body=body,
+        score=score,
+        author=SimpleNamespace(name=author) if author else None,
+    )
+
+
+class TestFetchSubmission:
+    """Test post/comment assembly from a fetched submission."""
+
+    def _reddit(self, comments, replace_more_calls):
+        """Fake praw.Reddit returning one submission with the given comments."""
+        forest = SimpleNamespace(
+            replace_more=lambda **kwargs: replace_more_calls.append(kwargs),
+            list=lambda: list(comments),
+        )
+        submission = SimpleNamespace(
+            title="My PCS strategy",
+            author="op",
+            selftext="Post body",
+            comments=forest,
+            score=42,
+            num_comments=len(comments),
+            created_utc=1700000000,
+        )
+        return SimpleNamespace(submission=lambda id: submission)
+
+    def test_comments_ordered_and_cut(self, monkeypatch):
+        """Test score ordering, MAX_COMMENTS cut, empty bodies and [deleted] authors."""
+        monkeypatch.setattr(reddit, "MAX_COMMENTS", 3)
+        replace_more_calls = []
+        comments = [
+            _comment("low", 1),
+            _comment("top", 50, author=None),
+            _comment("", 40),  # no body: kept in the cut, skipped in output
+            _comment("mid", 10),
+            _comment("dropped", 0),
+        ]
+
+        post = _fetch_submission_sync(self._reddit(comments, replace_more_calls), "abc123")
+
+        assert replace_more_calls == [{
+            "limit": reddit.MORE_COMMENTS_LIMIT,
+            "threshold": reddit.MORE_COMMENTS_THRESHOLD,
+        }]
+        assert post["comment_content"] == (
+            "[[deleted] | +50]: top\n\n---\n\n[user | +10]: mid"
+        )
+        assert post["full_content"] == (
+            "# My PCS strategy\n\nPost body\n\n## Comments\n\n" + post["comment_content"]
+        )
+        assert post["author"] == "op"
+        assert post["score"] == 42
+
+    def test_no_comments(self):
+        """Test that a post without comments has empty comment content."""
+        post = _fetch_submission_sync(self._reddit([], []), "abc123")
+
+        assert post["comment_content"] == ""
+        assert post["full_content"] == "# My PCS strategy\n\nPost body\n\n## Comments\n\n"
@@ -4,7 +4,11 @@ Test cases TC-SS-001 through TC-SS-005.
 """
 
 import pytest
-from app.scoring.scorer import calculate_specificity_score, calculate_trust_score
+from app.scoring.scorer import (
+    calculate_specificity_score,
+    calculate_trust_score,
+    score_extraction,
+)
 from app.models import (
     ExtractedStrategy,
     ExtractedField,
@@ -17,16 +21,17 @@ from app.models import (
 )
 
 
+# Shared inputs for trust scoring (tuples; validated into lists by the models)
+_BALANCED_FAILURES = ("gap risk", "assignment", "VIX spike")
+_BALANCED_WARNINGS = ("Not suitable for small accounts", "Requires margin")
+
+
 class TestSpecificityScoring:
     """Test suite for Specificity scoring."""
 
     def _create_strategy(self, **kwargs) -> ExtractedStrategy:
-        """Helper to create strategy with custom fields."""
-        strategy = ExtractedStrategy()
-        for key, value in kwargs.items():
-            if hasattr(strategy, key):
-                setattr(strategy, key, value)
-        return strategy
+        """Helper to create strategy with custom fields (trusted input, not validated)."""
+        return ExtractedStrategy.model_construct(**kwargs)
 
     # TC-SS-001: Complete high-specificity strategy
     def test_high_specificity_strategy(self):
@@ -126,12 +131,12 @@ class TestTrustScoring:
         """Test high trust score for balanced content."""
         strategy = ExtractedStrategy(
             failure_analysis=FailureModeAnalysis(
-                failure_modes_mentioned=["gap risk", "assignment", "VIX spike"],
+                failure_modes_mentioned=_BALANCED_FAILURES,
                 discusses_losses=True,
                 max_drawdown_mentioned=20.0,
                 bias_detected=False,
             ),
-            warnings=["Not suitable for small accounts", "Requires margin"],
+            warnings=_BALANCED_WARNINGS,
             risk_profile=RiskProfile(
                 max_drawdown=ExtractedNumericField(value=20.0, confidence=0.9, interpretation="explicit"),
             ),
@@ -144,12 +149,31 @@ class TestTrustScoring:
         """Test low trust score for win-only content."""
         strategy = ExtractedStrategy(
             failure_analysis=FailureModeAnalysis(
-                failure_modes_mentioned=[],
+                failure_modes_mentioned=(),
                 discusses_losses=False,
                 bias_detected=True,
             ),
-            warnings=[],
+            warnings=(),
         )
         
         trust_score = calculate_trust_score(strategy)
         assert trust_score < 3.0
+
+
+class TestCombinedScoring:
+    """Test suite for combined scoring."""
+
+    def test_score_extraction_matches_individual_scores(self):
+        """Test that combined scoring matches the separate scorers."""
+        strategy = ExtractedStrategy(
+            failure_analysis=FailureModeAnalysis(
+                failure_modes_mentioned=("gap risk",),
+                discusses_losses=True,
+                bias_detected=False,
+            ),
+            warnings=("Requires margin",),
+        )
+        
+        metrics = score_extraction(strategy)
+        assert metrics.specificity_score == calculate_specificity_score(strategy).specificity_score
+        assert metrics.trust_score == calculate_trust_score(strategy)
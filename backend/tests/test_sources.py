@@ -4,87 +4,107 @@ Tests CRUD operations for source persistence.
 """
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
-from app.db.database import SourceDB, Base, engine
+from app.db.database import SourceDB, Base, engine, get_db
+from app.api.sources import source_to_db, source_db_to_model
+from app.models import (
+    Source, ExtractedStrategy, QualityMetrics, PlatformMetrics,
+    SetupRules, ExtractedNumericField,
+)
 
 
-@pytest.fixture
-async def test_client():
-    """Create async test client."""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+@pytest.fixture(scope="session")
+def asgi_transport():
+    """ASGI transport for the app, built once per test session."""
+    return ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def test_client(asgi_transport):
+    """Create async test client (shared by every test in the module)."""
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         yield client
 
 
 @pytest.fixture
 def mock_db_session():
-    """Create a mock database session."""
-    session = AsyncMock()
-    session.execute = AsyncMock()
-    session.commit = AsyncMock()
-    session.add = MagicMock()
-    return session
+    """Create a mock database session (async methods are AsyncMocks via the spec)."""
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def patched_db(request, mock_db_session):
+    """
+    Override get_db with a mock session for one test.
+    request.param is what the query result returns from both
+    scalars().all() and scalar_one_or_none().
+    """
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = request.param
+    mock_result.scalar_one_or_none.return_value = request.param
+    mock_db_session.execute.return_value = mock_result
+    
+    async def override_get_db():
+        yield mock_db_session
+    
+    app.dependency_overrides[get_db] = override_get_db
+    yield mock_db_session
+    app.dependency_overrides.pop(get_db, None)
 
 
 class TestSourcesAPI:
     """Test suite for /api/sources endpoints."""
     
     @pytest.mark.asyncio
-    async def test_list_sources_empty(self, test_client):
-        """Test listing sources when database is empty."""
-        with patch('app.api.sources.get_db') as mock_get_db:
-            mock_session = AsyncMock()
-            mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = []
-            mock_session.execute.return_value = mock_result
-            
-            async def mock_gen():
-                yield mock_session
-            mock_get_db.return_value = mock_gen()
-            
-            response = await test_client.get("/api/sources")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["total"] == 0
-            assert data["sources"] == []
-    
-    @pytest.mark.asyncio
-    async def test_get_source_not_found(self, test_client):
-        """Test getting a source that doesn't exist."""
-        with patch('app.api.sources.get_db') as mock_get_db:
-            mock_session = AsyncMock()
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = None
-            mock_session.execute.return_value = mock_result
-            
-            async def mock_gen():
-                yield mock_session
-            mock_get_db.return_value = mock_gen()
-            
-            response = await test_client.get("/api/sources/nonexistent")
-            
-            assert response.status_code == 404
+    @pytest.mark.parametrize(
+        "method,url,expected_status,expected_json,patched_db",
+        [
+            ("get", "/api/sources", 200, {"sources": [], "total": 0}, []),
+            ("get", "/api/sources/nonexistent", 404, {"detail": "Source not found"}, None),
+            ("delete", "/api/sources/nonexistent", 404, {"detail": "Source not found"}, None),
+        ],
+        ids=["list_sources_empty", "get_source_not_found", "delete_source_not_found"],
+        indirect=["patched_db"],
+    )
+    async def test_endpoint(self, test_client, patched_db, method, url, expected_status, expected_json):
+        """Test endpoint status and body against a mocked database."""
+        response = await test_client.request(method.upper(), url)
+        
+        assert response.status_code == expected_status
+        assert response.json() == expected_json
     
     @pytest.mark.asyncio
-    async def test_delete_source_not_found(self, test_client):
-        """Test deleting a source that doesn't exist."""
-        with patch('app.api.sources.get_db') as mock_get_db:
-            mock_session = AsyncMock()
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = None
-            mock_session.execute.return_value = mock_result
-            
-            async def mock_gen():
-                yield mock_session
-            mock_get_db.return_value = mock_gen()
-            
-            response = await test_client.delete("/api/sources/nonexistent")
-            
-            assert response.status_code == 404
+    @pytest.mark.parametrize("patched_db", [None], indirect=True)
+    async def test_save_source_value_range_input(self, test_client, patched_db):
+        """Test that a posted value_range pair is kept, not dropped as an unknown key."""
+        payload = {
+            "id": "range456",
+            "url": "https://youtube.com/watch?v=range",
+            "source_type": "youtube",
+            "title": "Range Input",
+            "author": "Test Author",
+            "extracted_data": {
+                "setup_rules": {
+                    "dte": {"value": 30, "value_range": [30, 45], "confidence": 0.9, "interpretation": "explicit"},
+                },
+            },
+        }
+        
+        response = await test_client.post("/api/sources", json=payload)
+        
+        assert response.status_code == 200
+        dte = response.json()["source"]["extracted_data"]["setup_rules"]["dte"]
+        assert dte["value_range"] == [30.0, 45.0]
+        assert (dte["value_range_min"], dte["value_range_max"]) == (30.0, 45.0)
+        
+        saved = patched_db.add.call_args.args[0]
+        saved_dte = saved.extracted_data["setup_rules"]["dte"]
+        assert (saved_dte["value_range_min"], saved_dte["value_range_max"]) == (30.0, 45.0)
 
 
 class TestSourceDBModel:
@@ -116,9 +136,6 @@ class TestSourceConversion:
     
     def test_source_to_db_basic(self):
         """Test converting a simple Source to SourceDB."""
-        from app.api.sources import source_to_db
-        from app.models import Source, ExtractedStrategy, QualityMetrics, PlatformMetrics
-        
         source = Source(
             id="conv123",
             url="https://youtube.com/watch?v=abc",
@@ -136,3 +153,41 @@ class TestSourceConversion:
         assert db_source.url == "https://youtube.com/watch?v=abc"
         assert db_source.specificity_score == 6.5
         assert db_source.trust_score == 5.0
+    
+    def test_value_range_round_trip(self):
+        """Test that numeric ranges are serialized and restored from the database."""
+        source = Source(
+            id="range123",
+            url="https://youtube.com/watch?v=xyz",
+            source_type="youtube",
+            title="Range Test",
+            author="Test Author",
+            transcript_or_content="Content",
+            extracted_data=ExtractedStrategy(
+                setup_rules=SetupRules(
+                    dte=ExtractedNumericField(value=30, value_range_min=30, value_range_max=45),
+                ),
+            ),
+        )
+        
+        db_source = source_to_db(source)
+        assert db_source.extracted_data["setup_rules"]["dte"]["value_range"] == (30.0, 45.0)
+        
+        restored = source_db_to_model(db_source)
+        assert restored.extracted_data.setup_rules.dte.value_range == (30.0, 45.0)
+        
+        # Rows saved before the bounds were stored as scalars only carry value_range
+        del db_source.extracted_data["setup_rules"]["dte"]["value_range_min"]
+        del db_source.extracted_data["setup_rules"]["dte"]["value_range_max"]
+        restored = source_db_to_model(db_source)
+        assert restored.extracted_data.setup_rules.dte.value_range == (30.0, 45.0)
+    
+    def test_value_range_model_validate(self):
+        """Test that the serialized value_range shape validates back into the bounds."""
+        strategy = ExtractedStrategy.model_validate({
+            "setup_rules": {"dte": {"value": 30, "value_range": [30, 45]}},
+        })
+        
+        assert strategy.setup_rules.dte.value_range_min == 30.0
+        assert strategy.setup_rules.dte.value_range_max == 45.0
+        assert ExtractedNumericField(value_range=(30, 45)).value_range == (30.0, 45.0)
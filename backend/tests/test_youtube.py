@@ -10,51 +10,29 @@ from app.extractors.youtube import YouTubeExtractor
 class TestYouTubeExtractor:
     """Test suite for YouTubeExtractor."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.extractor = YouTubeExtractor()
-
-    # TC-YT-001: Standard YouTube URL
-    def test_extract_video_id_standard_url(self):
-        """Test video ID extraction from standard YouTube URL."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        video_id = self.extractor.extract_video_id(url)
-        assert video_id == "dQw4w9WgXcQ"
-
-    # TC-YT-002: Shortened URL
-    def test_extract_video_id_shortened_url(self):
-        """Test video ID extraction from youtu.be URL."""
-        url = "https://youtu.be/dQw4w9WgXcQ"
-        video_id = self.extractor.extract_video_id(url)
-        assert video_id == "dQw4w9WgXcQ"
-
-    # TC-YT-003: Embed URL
-    def test_extract_video_id_embed_url(self):
-        """Test video ID extraction from embed URL."""
-        url = "https://www.youtube.com/embed/dQw4w9WgXcQ"
-        video_id = self.extractor.extract_video_id(url)
-        assert video_id == "dQw4w9WgXcQ"
-
-    # TC-YT-004: URL with additional parameters
-    def test_extract_video_id_with_params(self):
-        """Test video ID extraction from URL with extra params."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=120s"
-        video_id = self.extractor.extract_video_id(url)
-        assert video_id == "dQw4w9WgXcQ"
-
-    # TC-YT-005: Invalid URL
-    def test_extract_video_id_invalid_url(self):
-        """Test that invalid URL returns None."""
-        url = "https://example.com/video"
-        video_id = self.extractor.extract_video_id(url)
-        assert video_id is None
-
-    def test_validate_url_valid(self):
+    @pytest.fixture(scope="class")
+    def extractor(self):
+        """Shared extractor (it holds no per-test state)."""
+        return YouTubeExtractor()
+
+    # TC-YT-001..005: standard, shortened, embed, extra params, invalid
+    @pytest.mark.parametrize("url,expected", [
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=120s", "dQw4w9WgXcQ"),
+        ("https://example.com/video", None),
+    ], ids=["TC-YT-001", "TC-YT-002", "TC-YT-003", "TC-YT-004", "TC-YT-005"])
+    def test_extract_video_id(self, extractor, url, expected):
+        """Test video ID extraction across URL formats."""
+        assert extractor.extract_video_id(url) == expected
+
+    def test_validate_url_valid(self, extractor):
         """Test URL validation for valid YouTube URLs."""
-        assert self.extractor.validate_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
-        assert self.extractor.validate_url("https://youtu.be/dQw4w9WgXcQ")
+        assert extractor.validate_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        assert extractor.validate_url("https://youtu.be/dQw4w9WgXcQ")
 
-    def test_validate_url_invalid(self):
+    def test_validate_url_invalid(self, extractor):
         """Test URL validation for invalid URLs."""
-        assert not self.extractor.validate_url("https://reddit.com/r/options")
-        assert not self.extractor.validate_url("not a url")
+        assert not extractor.validate_url("https://reddit.com/r/options")
+        assert not extractor.validate_url("not a url")
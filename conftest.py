@@ -0,0 +1,6 @@
+"""
+Root pytest configuration.
+Keeps the standalone POC scripts out of test collection.
+"""
+
+collect_ignore = ["poc_extract_strategy.py", "poc_transcript.py"]
@@ -7,19 +7,47 @@ Uses Gemini API to extract structured strategy data from video transcripts.
 import json
 import os
 import re
-from youtube_transcript_api import YouTubeTranscriptApi
+from functools import lru_cache
+from importlib.util import find_spec
 
-# Check for google.generativeai
+# Check for google.generativeai without importing it; the heavy SDK imports
+# (Gemini, transcript API) happen inside the functions that use them
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    GEMINI_AVAILABLE = find_spec("google.generativeai") is not None
 except ImportError:
     GEMINI_AVAILABLE = False
+if not GEMINI_AVAILABLE:
     print("⚠️  google-generativeai not installed. Install with: pip install google-generativeai")
 
 VIDEO_ID = "55ox9fB3x-E"
 
-# Strategy extraction prompt template
+# Transcript characters sent to the model (context limit)
+MAX_TRANSCRIPT_CHARS = 30000
+
+# Rule-based patterns, compiled once. Alternatives are fused so each pattern
+# family scans the transcript a single time; the leftmost match wins.
+_DTE_RE = re.compile(
+    r'(?P<dte1>\d+)\s*(?:day|dte)'
+    r'|(?P<dte2>\d+)\s*days?\s*(?:to|until)\s*expir'
+    r'|expire\s*(?:in|within)\s*(?P<dte3>\d+)'
+)
+_PROFIT_RE = re.compile(
+    r'(?P<pt1>\d+)%?\s*(?:of\s*)?(?:credit|premium)'
+    r'|take\s*profit\s*(?:at\s*)?(?P<pt2>\d+)'
+    r'|close\s*(?:at\s*)?(?P<pt3>\d+)%'
+)
+_DOLLAR_RE = re.compile(r'\$([0-9,]+(?:\.\d{2})?)')
+# Markdown code fence that Gemini sometimes wraps around its JSON
+_MD_PREFIX = re.compile(r'^```(?:json)?\n?')
+_MD_SUFFIX = re.compile(r'\n?```$')
+# Keyword phrases, longest first where one contains another
+_KEYWORDS_RE = re.compile(
+    r'put credit spread|credit spread|iron condor|wheel'
+    r'|at the money|atm|out of the money|otm|s&p|spx|spy'
+)
+
+# Strategy extraction prompt template. Filled with str.replace, not str.format,
+# so the JSON example needs no brace escaping.
 EXTRACTION_PROMPT = """You are an expert options trading analyst. Analyze the following YouTube video transcript and extract structured information about the trading strategy discussed.
 
 VIDEO TRANSCRIPT:
@@ -29,14 +57,14 @@ VIDEO TRANSCRIPT:
 
 Extract the following information in JSON format. If information is not mentioned, use null.
 
-{{
-  "strategy_overview": {{
+{
+  "strategy_overview": {
     "name": "Name of the strategy (e.g., 'ATM Put Credit Spreads on SPX')",
     "one_liner": "One sentence summary of the strategy",
     "trader_name": "Name of the trader being interviewed, if mentioned",
     "experience_level": "How long they've been trading this strategy"
-  }},
-  "setup_rules": {{
+  },
+  "setup_rules": {
     "underlying": "What they trade (e.g., SPX, SPY, individual stocks)",
     "option_type": "Type of options (puts, calls, spreads, etc.)",
     "strike_selection": "How they choose strikes (ATM, OTM, delta-based, etc.)",
@@ -44,27 +72,27 @@ Extract the following information in JSON format. If information is not mentione
     "position_sizing": "How they size positions relative to account",
     "entry_criteria": "What conditions trigger an entry",
     "time_of_day": "When they typically enter trades"
-  }},
-  "management_rules": {{
+  },
+  "management_rules": {
     "profit_target": "When they take profits (e.g., 50% of credit)",
     "stop_loss": "When they cut losses",
     "adjustment_rules": "How they adjust losing trades",
     "hold_to_expiration": "Do they let positions expire or close early?",
     "rolling_rules": "Do they roll positions? When?"
-  }},
-  "risk_profile": {{
+  },
+  "risk_profile": {
     "max_loss_per_trade": "Maximum loss on a single trade",
     "win_rate_claimed": "Win rate mentioned by trader",
     "risk_reward_ratio": "Typical risk to reward",
     "account_drawdown_mentioned": "Any drawdowns or losing streaks mentioned"
-  }},
-  "performance_claims": {{
+  },
+  "performance_claims": {
     "starting_capital": "Initial account size",
     "current_capital": "Current account size",
     "total_return_percent": "Percentage return claimed",
     "time_period": "Over what time period",
     "profits_withdrawn": "Any profits taken out"
-  }},
+  },
   "key_insights": [
     "List of unique insights or tips mentioned",
     "Things the trader does differently",
@@ -78,7 +106,7 @@ Extract the following information in JSON format. If information is not mentione
   "quotes": [
     "Notable direct quotes from the transcript that capture key ideas"
   ]
-}}
+}
 
 Return ONLY valid JSON, no markdown formatting or explanation.
 """
@@ -86,17 +114,43 @@ Return ONLY valid JSON, no markdown formatting or explanation.
 
 def fetch_transcript(video_id):
     """Fetch transcript for a YouTube video."""
+    from youtube_transcript_api import YouTubeTranscriptApi
+    
     try:
         ytt_api = YouTubeTranscriptApi()
         fetched = ytt_api.fetch(video_id, languages=['en', 'en-US', 'en-GB'])
         transcript_data = list(fetched)
-        full_text = " ".join([entry.text for entry in transcript_data])
+        full_text = " ".join(entry.text for entry in transcript_data)
         return full_text, transcript_data
     except Exception as e:
         print(f"❌ Failed to fetch transcript: {e}")
         return None, None
 
 
+# Models to try, in order of preference
+GEMINI_MODELS = [
+    'gemini-2.5-flash',
+    'gemini-2.5-pro',
+    'gemini-2.0-flash-lite',
+    'gemini-flash-latest',
+]
+
+# Model that last returned a usable response; tried first on later calls
+_PREFERRED_MODEL = None
+
+
+@lru_cache(maxsize=8)
+def _get_model(api_key, model_name):
+    """
+    Build each GenerativeModel once per (key, model) pair.
+    A model binds the client for the key configured when it first generates,
+    so it is cached under that key and never reused for another one.
+    """
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
 def extract_strategy_with_gemini(transcript_text, api_key=None):
     """Use Gemini to extract structured strategy data."""
     if not GEMINI_AVAILABLE:
@@ -108,33 +162,35 @@ def extract_strategy_with_gemini(transcript_text, api_key=None):
         print("❌ No Gemini API key found. Set GEMINI_API_KEY or GOOGLE_API_KEY environment variable.")
         return None
     
-    genai.configure(api_key=api_key)
-    
-    # Try multiple models in order of preference
-    models_to_try = [
-        'gemini-2.5-flash',
-        'gemini-2.5-pro', 
-        'gemini-2.0-flash-lite',
-        'gemini-flash-latest',
-    ]
+    # Try multiple models, starting with the last one that worked
+    global _PREFERRED_MODEL
+    models_to_try = GEMINI_MODELS
+    if _PREFERRED_MODEL:
+        models_to_try = [_PREFERRED_MODEL] + [m for m in GEMINI_MODELS if m != _PREFERRED_MODEL]
     
-    prompt = EXTRACTION_PROMPT.format(transcript=transcript_text[:30000])  # Limit context
+    # Limit context; only copy the transcript when it actually needs trimming
+    if len(transcript_text) > MAX_TRANSCRIPT_CHARS:
+        transcript_text = transcript_text[:MAX_TRANSCRIPT_CHARS]
+    prompt = EXTRACTION_PROMPT.replace("{transcript}", transcript_text)
     
     for model_name in models_to_try:
         print(f"🤖 Trying model: {model_name}...")
         try:
-            model = genai.GenerativeModel(model_name)
+            model = _get_model(api_key, model_name)
             response = model.generate_content(prompt)
             response_text = response.text.strip()
             
             # Clean up response - remove markdown code blocks if present
-            if response_text.startswith('```'):
-                response_text = re.sub(r'^```(?:json)?\n?', '', response_text)
-                response_text = re.sub(r'\n?```$', '', response_text)
+            if response_text.startswith('```json\n') and response_text.endswith('\n```'):
+                response_text = response_text[8:-4]
+            elif response_text.startswith('```'):
+                response_text = _MD_PREFIX.sub('', response_text)
+                response_text = _MD_SUFFIX.sub('', response_text)
             
             # Parse JSON
             extracted = json.loads(response_text)
             print(f"✅ Success with {model_name}!")
+            _PREFERRED_MODEL = model_name
             return extracted
         except json.JSONDecodeError as e:
             print(f"❌ {model_name}: Failed to parse JSON: {e}")
@@ -171,60 +227,53 @@ def extract_strategy_rule_based(transcript_text):
     }
     
     text_lower = transcript_text.lower()
+    # Scan once for all keyword phrases
+    hits = set(_KEYWORDS_RE.findall(text_lower))
     
     # Detect strategy type
-    if "credit spread" in text_lower:
+    if "credit spread" in hits:
         extracted["strategy_overview"]["name"] = "Credit Spreads"
-    if "put credit spread" in text_lower:
+    if "put credit spread" in hits:
         extracted["strategy_overview"]["name"] = "Put Credit Spreads"
-    if "iron condor" in text_lower:
+    if "iron condor" in hits:
         extracted["strategy_overview"]["name"] = "Iron Condor"
-    if "wheel" in text_lower:
+    if "wheel" in hits:
         extracted["strategy_overview"]["name"] = "Wheel Strategy"
     
     # Detect underlying
-    if "s&p" in text_lower or "spx" in text_lower or "spy" in text_lower:
+    if "s&p" in hits or "spx" in hits or "spy" in hits:
         extracted["setup_rules"]["underlying"] = "S&P 500 (SPX/SPY)"
     
     # Detect strike selection
-    if "at the money" in text_lower or "atm" in text_lower:
+    if "at the money" in hits or "atm" in hits:
         extracted["setup_rules"]["strike_selection"] = "At The Money (ATM)"
-    elif "out of the money" in text_lower or "otm" in text_lower:
+    elif "out of the money" in hits or "otm" in hits:
         extracted["setup_rules"]["strike_selection"] = "Out of The Money (OTM)"
     
     # Detect DTE
-    dte_patterns = [
-        r'(\d+)\s*(?:day|dte)',
-        r'(\d+)\s*days?\s*(?:to|until)\s*expir',
-        r'expire\s*(?:in|within)\s*(\d+)'
-    ]
-    for pattern in dte_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            extracted["setup_rules"]["expiration"] = f"{match.group(1)} DTE"
-            break
+    match = _DTE_RE.search(text_lower)
+    if match:
+        dte = match["dte1"] or match["dte2"] or match["dte3"]
+        extracted["setup_rules"]["expiration"] = f"{dte} DTE"
     
     # Detect profit target
-    profit_patterns = [
-        r'(\d+)%?\s*(?:of\s*)?(?:credit|premium)',
-        r'take\s*profit\s*(?:at\s*)?(\d+)',
-        r'close\s*(?:at\s*)?(\d+)%'
-    ]
-    for pattern in profit_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            extracted["management_rules"]["profit_target"] = f"{match.group(1)}% of credit"
-            break
+    match = _PROFIT_RE.search(text_lower)
+    if match:
+        target = match["pt1"] or match["pt2"] or match["pt3"]
+        extracted["management_rules"]["profit_target"] = f"{target}% of credit"
     
     # Extract dollar amounts for performance
-    dollar_pattern = r'\$([0-9,]+(?:\.\d{2})?)'
-    amounts = re.findall(dollar_pattern, transcript_text)
-    if len(amounts) >= 2:
-        amounts_cleaned = [int(a.replace(',', '').split('.')[0]) for a in amounts]
-        amounts_cleaned = sorted(set(amounts_cleaned))
-        if len(amounts_cleaned) >= 2:
-            extracted["performance_claims"]["starting_capital"] = f"${amounts_cleaned[0]:,}"
-            extracted["performance_claims"]["current_capital"] = f"${amounts_cleaned[-1]:,}"
+    # Only the smallest and largest amounts are used, so track them in one pass
+    lo = hi = None
+    for match in _DOLLAR_RE.finditer(transcript_text):
+        amount = int(match.group(1).replace(',', '').partition('.')[0])
+        if lo is None or amount < lo:
+            lo = amount
+        if hi is None or amount > hi:
+            hi = amount
+    if lo != hi:
+        extracted["performance_claims"]["starting_capital"] = f"${lo:,}"
+        extracted["performance_claims"]["current_capital"] = f"${hi:,}"
     
     return extracted
 
@@ -246,27 +295,27 @@ def display_results(extracted):
     
     # Setup Rules
     setup = extracted.get("setup_rules", {})
-    if any(setup.values()):
+    rows = [(key, value) for key, value in setup.items() if value]
+    if rows:
         print("\n📋 SETUP RULES:")
-        for key, value in setup.items():
-            if value:
-                print(f"   • {key.replace('_', ' ').title()}: {value}")
+        for key, value in rows:
+            print(f"   • {key.replace('_', ' ').title()}: {value}")
     
     # Management Rules
     mgmt = extracted.get("management_rules", {})
-    if any(mgmt.values()):
+    rows = [(key, value) for key, value in mgmt.items() if value]
+    if rows:
         print("\n⚙️ MANAGEMENT RULES:")
-        for key, value in mgmt.items():
-            if value:
-                print(f"   • {key.replace('_', ' ').title()}: {value}")
+        for key, value in rows:
+            print(f"   • {key.replace('_', ' ').title()}: {value}")
     
     # Performance
     perf = extracted.get("performance_claims", {})
-    if any(perf.values()):
+    rows = [(key, value) for key, value in perf.items() if value]
+    if rows:
         print("\n📈 PERFORMANCE CLAIMS:")
-        for key, value in perf.items():
-            if value:
-                print(f"   • {key.replace('_', ' ').title()}: {value}")
+        for key, value in rows:
+            print(f"   • {key.replace('_', ' ').title()}: {value}")
     
     # Key Insights
     insights = extracted.get("key_insights", [])
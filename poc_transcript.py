@@ -5,13 +5,76 @@ Video: https://youtu.be/55ox9fB3x-E
 Updated for youtube-transcript-api v1.2.x (instance-based API)
 """
 
-from youtube_transcript_api import YouTubeTranscriptApi
-import json
+import sys
+from operator import attrgetter
+from pathlib import Path
+
+# orjson serializes large transcripts much faster; fall back to stdlib json
+try:
+    import orjson
+
+    def _dumps(obj, indent=True) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+except ImportError:
+    import json
+
+    def _dumps(obj, indent=True) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
 
 VIDEO_ID = "55ox9fB3x-E"
+OUTPUT_FILE = "transcript_output.json"
+SEGMENTS_FILE = "transcript_segments.jsonl"
+PREVIEW_CHARS = 2000
+SAMPLE_SEGMENTS = 20
+
+
+# Reads all three segment attributes in one C-level call
+_segment_fields = attrgetter("text", "start", "duration")
+
 
-def fetch_transcript(video_id):
-    """Fetch transcript for a YouTube video."""
+def _segment_dict(segment):
+    """Plain-dict form of a transcript segment for JSON output."""
+    text, start, duration = _segment_fields(segment)
+    return {"text": text, "start": start, "duration": duration}
+
+
+def stream_segments(fetched, path):
+    """
+    Write segments to a JSONL file one line at a time, without building the
+    full transcript text. Returns (segment count, total characters, preview,
+    sample segments), with totals matching the joined-text mode.
+    """
+    count = 0
+    total_chars = -1  # no separator before the first segment
+    preview_parts = []
+    preview_len = 0
+    sample = []
+    
+    with open(path, "wb") as f:
+        for segment in fetched:
+            text = segment.text
+            f.write(_dumps(_segment_dict(segment), indent=False) + b"\n")
+            count += 1
+            total_chars += len(text) + 1
+            if preview_len < PREVIEW_CHARS:
+                preview_parts.append(text)
+                preview_len += len(text) + 1
+            if len(sample) < SAMPLE_SEGMENTS:
+                sample.append(_segment_dict(segment))
+    
+    preview = " ".join(preview_parts)[:PREVIEW_CHARS]
+    return count, max(total_chars, 0), preview, sample
+
+
+def fetch_transcript(video_id, stream=False):
+    """
+    Fetch transcript for a YouTube video.
+    With stream=True, segments go straight to a JSONL sidecar file and the
+    full text is never held in memory; the sidecar path is returned.
+    """
+    # Imported here so importing this module stays cheap
+    from youtube_transcript_api import YouTubeTranscriptApi
+    
     try:
         print("=" * 60)
         print(f"Fetching transcript for video: {video_id}")
@@ -35,36 +98,44 @@ def fetch_transcript(video_id):
         # Fetch the transcript (prefer English)
         fetched = ytt_api.fetch(video_id, languages=['en', 'en-US', 'en-GB'])
         
-        # Convert to list and combine text
-        transcript_data = list(fetched)
-        full_text = " ".join([entry.text for entry in transcript_data])
+        if stream:
+            total_segments, total_characters, preview, sample = stream_segments(fetched, SEGMENTS_FILE)
+        else:
+            # Convert to list and combine text
+            transcript_data = list(fetched)
+            full_text = " ".join(entry.text for entry in transcript_data)
+            total_segments, total_characters = len(transcript_data), len(full_text)
+            preview = full_text[:PREVIEW_CHARS]
+            sample = [
+                {"text": text, "start": start, "duration": duration}
+                for text, start, duration in map(_segment_fields, transcript_data[:SAMPLE_SEGMENTS])
+            ]
         
-        print("\nTRANSCRIPT PREVIEW (first 2000 chars):")
+        print(f"\nTRANSCRIPT PREVIEW (first {PREVIEW_CHARS} chars):")
         print("-" * 60)
-        print(full_text[:2000])
+        print(preview)
         print("-" * 60)
         
-        print(f"\n✅ SUCCESS! Got {len(transcript_data)} segments, {len(full_text)} total characters")
+        print(f"\n✅ SUCCESS! Got {total_segments} segments, {total_characters} total characters")
         
-        # Save full transcript to file
+        # Save transcript (or, in stream mode, a summary pointing at the segments file)
         output = {
             "video_id": video_id,
             "video_url": f"https://youtu.be/{video_id}",
-            "total_segments": len(transcript_data),
-            "total_characters": len(full_text),
-            "full_text": full_text,
-            "segments_sample": [
-                {"text": s.text, "start": s.start, "duration": s.duration} 
-                for s in transcript_data[:20]
-            ]
+            "total_segments": total_segments,
+            "total_characters": total_characters,
         }
+        if stream:
+            output["segments_file"] = SEGMENTS_FILE
+        else:
+            output["full_text"] = full_text
+        output["segments_sample"] = sample
         
-        with open("transcript_output.json", "w") as f:
-            json.dump(output, f, indent=2)
+        Path(OUTPUT_FILE).write_bytes(_dumps(output))
         
-        print(f"\n📁 Full transcript saved to: transcript_output.json")
+        print(f"\n📁 Full transcript saved to: {SEGMENTS_FILE if stream else OUTPUT_FILE}")
         
-        return transcript_data
+        return SEGMENTS_FILE if stream else transcript_data
         
     except Exception as e:
         print(f"❌ ERROR: {type(e).__name__}: {e}")
@@ -73,6 +144,8 @@ def fetch_transcript(video_id):
         return None
 
 if __name__ == "__main__":
+    # --stream: write segments to a JSONL file instead of joining the full text
+    stream = "--stream" in sys.argv[1:]
     print(f"Testing YouTube Transcript API on video: {VIDEO_ID}")
     print(f"URL: https://youtu.be/{VIDEO_ID}\n")
-    fetch_transcript(VIDEO_ID)
+    fetch_transcript(VIDEO_ID, stream=stream)